@@ -1,38 +1,648 @@
+import os
+import sys
 import time
+import asyncio
+import threading
 import csv
 import json
-import re
+import functools
+import atexit
+import shutil
+import subprocess
 from datetime import datetime
+from urllib.parse import urlsplit
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    TimeoutException,
-    NoSuchElementException,
-    StaleElementReferenceException,
-)
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard json module
+    orjson = None
+
+# View counts as shown in the dashboard: 50, 100, 4.4K, 3.5K, 1.2M, etc.
+# Passed to the injected collector scripts, which build their RegExp from it
+# once per call instead of each carrying their own copy of the pattern.
+_VIEW_COUNT_PATTERN = r"^(\d+\.?\d*)\s*([KMBkmb])?$"
+
+# Chrome profile kept between runs so the Instagram session survives restarts
+DEFAULT_PROFILE_DIR = os.path.expanduser("~/.ig_scraper_profile")
+
+
+# Request URL patterns blocked while block_media is on. CDN URLs carry query
+# strings, so every pattern ends in a wildcard. Stylesheets and the main JS
+# bundles stay allowed because view counts are located by their on-screen
+# position.
+BLOCKED_MEDIA_URLS = [
+    # Images, video and audio
+    "*.jpg*",
+    "*.jpeg*",
+    "*.png*",
+    "*.webp*",
+    "*.heic*",
+    "*.mp4*",
+    "*.m4a*",
+    # Fonts
+    "*.woff*",
+    "*.ttf*",
+    # Third-party analytics and ad trackers
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*doubleclick*",
+    "*connect.facebook.net*",
+]
+
+
+# File in the profile directory remembering where Content Insights is
+INSIGHTS_URL_FILE = "insights_url.txt"
+# Path fragments of the Professional Dashboard insights pages; only such
+# URLs are remembered
+INSIGHTS_URL_MARKERS = ("/insights", "professional_dashboard")
+
+# Instagram web GraphQL endpoint and the app id its web client sends
+GRAPHQL_URL = "https://www.instagram.com/graphql/query/"
+INSTAGRAM_WEB_APP_ID = "936619743392459"
+
+# Write buffer for the files posts are streamed to during extraction
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+# Chrome executable used to start a browser for debugger_port reattachment.
+# Unset, the usual executable names and install locations are tried.
+CHROME_BINARY = os.environ.get("CHROME_BINARY")
+
+_CHROME_NAMES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+)
+_CHROME_PATHS = tuple(
+    os.path.join(
+        os.environ.get(var, ""), "Google", "Chrome", "Application", "chrome.exe"
+    )
+    for var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")
+    if os.environ.get(var)
+)
+_CHROME_MAC_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+
+
+# Collector injected by extract_post_views. It extracts ALL numbers with
+# their positions (50, 100, 4.4K, 3.5K, 1.2M, etc.) plus the post images.
+#
+# The whole sweep runs inside the page as one async script: it scrolls
+# through the page itself, and a MutationObserver queues the nodes
+# Instagram renders so only new content is scanned after each scroll.
+# The source is built once at import and the hot loops use indexed for
+# loops over the NodeLists rather than per-element callbacks.
+_HARVEST_JS = """
+const done = arguments[arguments.length - 1];
+
+// Match patterns:
+// - Plain numbers: 50, 100, 1000
+// - Decimal with K/M/B: 4.4K, 3.5K, 1.2M, 2.5B
+// - Plain with K/M/B: 100K, 50M
+const PATTERN = new RegExp(arguments[0]);
+const NODES_SEL = 'span,div,p';
+const SCAN_SEL = 'span,div,p,img';
+const settleMs = arguments[1];    // DOM/network quiet time after a scroll
+const maxStepMs = arguments[2];   // give up waiting for quiet after this
+const maxTotalMs = arguments[3];  // return what we have after this
+
+// Reported numbers as parallel arrays: texts[i] and rects[4i..4i+3]
+// (absolute top, left, width, height), so the result is sent back as
+// flat arrays instead of one object per number
+const texts = [];
+const rects = [];
+const images = [];
+
+// Numbers found by the current scan, measured together afterwards
+const candidates = [];
+const candidateTexts = [];
+
+// Images already reported, with the src they were reported with. Numbers
+// are not tracked per element: a virtualized grid can reuse the same node
+// for another post showing the same value, so they are deduplicated by
+// position and text in `cells` below instead.
+const reported = new WeakMap();
+// Each reported image's latest entry in `images`
+const imageEntries = new WeakMap();
+// Values already reported per ~150px grid cell, keyed by the packed
+// cell index, so repeats of the same number are dropped in the page
+const cells = new Map();
+// Matching elements that were not yet in a usable position
+const deferred = new Set();
+// Nodes added or changed since the last scan
+let pending = new Set([document.body]);
+// Time of the last DOM change or finished network request
+let lastActivity = performance.now();
+
+const observer = new MutationObserver(mutations => {
+    lastActivity = performance.now();
+    for (let i = 0, n = mutations.length; i < n; i++) {
+        const m = mutations[i];
+        if (m.type === 'characterData') {
+            if (m.target.parentElement) pending.add(m.target.parentElement);
+            continue;
+        }
+        if (m.type === 'attributes') {
+            // An <img> inserted before its src was set, or a recycled row
+            // moved to another post's position
+            pending.add(m.target);
+            continue;
+        }
+        const added = m.addedNodes;
+        for (let j = 0, k = added.length; j < k; j++) {
+            const node = added[j];
+            if (node.nodeType === Node.ELEMENT_NODE) {
+                pending.add(node);
+            } else if (node.parentElement) {
+                pending.add(node.parentElement);
+            }
+        }
+    }
+});
+observer.observe(document.body, {
+    childList: true, subtree: true, characterData: true,
+    attributes: true, attributeFilter: ['src', 'style']
+});
+
+// Finished fetches (post data XHRs, images) also count as activity, so a
+// step waits for the responses its scroll triggered instead of a fixed time
+const network = new PerformanceObserver(() => {
+    lastActivity = performance.now();
+});
+network.observe({type: 'resource'});
+
+function scanNumber(el) {
+    // Get direct text content only (not nested)
+    let text = '';
+    const children = el.childNodes;
+    for (let i = 0, n = children.length; i < n; i++) {
+        if (children[i].nodeType === Node.TEXT_NODE) {
+            text += children[i].textContent;
+        }
+    }
+    text = text.trim();
+
+    // Also check el.innerText if direct text is empty
+    if (!text && el.children.length === 0) {
+        text = el.innerText.trim();
+    }
+
+    if (!text || !PATTERN.test(text)) return;
+
+    candidates.push(el);
+    candidateTexts.push(text);
+}
+
+function measureCandidates() {
+    const n = candidates.length;
+    if (n === 0) return;
+
+    // Settle any pending layout once, then read every box in one batch
+    void document.body.offsetHeight;
+    const boxes = new Float32Array(4 * n);
+    for (let i = 0; i < n; i++) {
+        const rect = candidates[i].getBoundingClientRect();
+        boxes[4 * i] = rect.top;
+        boxes[4 * i + 1] = rect.left;
+        boxes[4 * i + 2] = rect.width;
+        boxes[4 * i + 3] = rect.height;
+    }
+    const scrollY = window.scrollY;
+
+    for (let i = 0; i < n; i++) {
+        const el = candidates[i];
+        const text = candidateTexts[i];
+
+        const top = boxes[4 * i];
+        const left = boxes[4 * i + 1];
+        const width = boxes[4 * i + 2];
+        const height = boxes[4 * i + 3];
+
+        // Must be visible and in reasonable position
+        if (!(width > 0 && height > 0 &&
+              top > 50 && top < 10000 &&
+              left > 0 && left < 2000)) {
+            deferred.add(el);
+            continue;
+        }
+
+        deferred.delete(el);
+
+        const absTop = top + scrollY;  // Absolute position
+        const gridX = Math.floor(left / 150);
+        const gridY = Math.floor(absTop / 150);
+        const key = ((gridX & 0xffff) << 16) | (gridY & 0xffff);
+        let cellTexts = cells.get(key);
+        if (!cellTexts) {
+            cellTexts = new Set();
+            cells.set(key, cellTexts);
+        }
+        if (cellTexts.has(text)) continue;
+        cellTexts.add(text);
+
+        texts.push(text);
+        rects.push(absTop, left, width, height);
+    }
+
+    candidates.length = 0;
+    candidateTexts.length = 0;
+}
+
+// Post thumbnails with their src/alt, read in the same script
+// so each view count can be paired with the image it overlays
+function scanImage(img) {
+    if (!img.src.includes('instagram') || reported.get(img) === img.src) {
+        return;
+    }
+
+    const rect = img.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0) {
+        deferred.add(img);
+        return;
+    }
+
+    reported.set(img, img.src);
+    deferred.delete(img);
+    const entry = {
+        src: img.src,
+        alt: img.alt || null,
+        top: rect.top + window.scrollY,
+        left: rect.left,
+        width: rect.width,
+        height: rect.height
+    };
+
+    // A src change in place (lazy or responsive loading) replaces the old
+    // entry; a recycled <img> at another post's position gets a new one
+    const previous = imageEntries.get(img);
+    if (previous && previous.top === entry.top && previous.left === entry.left) {
+        Object.assign(previous, entry);
+    } else {
+        images.push(entry);
+        imageEntries.set(img, entry);
+    }
+}
+
+function scanElement(el) {
+    if (el.tagName === 'IMG') {
+        scanImage(el);
+    } else if (el.matches(NODES_SEL)) {
+        scanNumber(el);
+    }
+}
+
+function scan(root) {
+    scanElement(root);
+    const nodes = root.querySelectorAll(SCAN_SEL);
+    for (let i = 0, n = nodes.length; i < n; i++) {
+        scanElement(nodes[i]);
+    }
+}
+
+function flush() {
+    const nodes = pending;
+    pending = new Set();
+    for (const node of nodes) {
+        if (node.isConnected) scan(node);
+    }
+    for (const el of Array.from(deferred)) {
+        if (el.isConnected) {
+            scanElement(el);
+        } else {
+            deferred.delete(el);
+        }
+    }
+    measureCandidates();
+}
+
+function finish(timedOut) {
+    observer.disconnect();
+    network.disconnect();
+    window.scrollTo(0, 0);
+    done({texts: texts, rects: rects, images: images, timedOut: timedOut});
+}
+
+const begin = performance.now();
+let position = 0;
+
+function step() {
+    window.scrollTo(0, position);
+    const started = performance.now();
+
+    (function waitForQuiet() {
+        const now = performance.now();
+        const quietFor = now - Math.max(started, lastActivity);
+        if (quietFor < settleMs && now - started < maxStepMs) {
+            setTimeout(waitForQuiet, 50);
+            return;
+        }
+
+        flush();
+
+        position += window.innerHeight - 100;  // Overlap slightly
+        if (position >= document.body.scrollHeight) {
+            finish(false);
+        } else if (now - begin >= maxTotalMs) {
+            finish(true);  // Stopped before reaching the bottom
+        } else {
+            step();
+        }
+    })();
+}
+
+step();
+"""
+
+
+# Serializes the manual login prompt when several profiles run at once
+_PROMPT_LOCK = threading.Lock()
+
+# Serializes the chromedriver download when several scrapers start at once
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _install_chromedriver():
+    """Download (or find the cached) chromedriver matching the local Chrome."""
+    return ChromeDriverManager().install()
+
+
+def _chromedriver_path():
+    """Resolve the chromedriver binary once per process."""
+    # lru_cache alone lets concurrent first calls all run the install
+    with _CHROMEDRIVER_LOCK:
+        return _install_chromedriver()
+
+
+def _find_chrome_binary():
+    """
+    Locate the Chrome executable to start for debugger_port.
+
+    Returns:
+        CHROME_BINARY if set, otherwise the first Chrome found on PATH or
+        in the standard Windows/macOS install locations, or None
+    """
+    if CHROME_BINARY:
+        return CHROME_BINARY
+
+    for name in _CHROME_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+
+    for path in (*_CHROME_PATHS, _CHROME_MAC_PATH):
+        if os.path.isfile(path):
+            return path
+
+    return None
+
+
+def _graphql_count(node, *fields):
+    """
+    Read a count from a GraphQL media node.
+
+    Args:
+        node: Node dictionary from fetch_graphql_edges
+        fields: Field names to try in order; each holds either the number
+            itself or a connection object with a 'count'
+
+    Returns:
+        The first count found as an int, or None
+    """
+    if not isinstance(node, dict):
+        return None
+
+    for field in fields:
+        value = node.get(field)
+        if isinstance(value, dict):
+            value = value.get("count")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(value)
+
+    return None
+
+
+def _profile_name(profile_dir):
+    """Name used for a profile's output files (the directory's basename)."""
+    return os.path.basename(os.path.normpath(profile_dir))
+
+
+def parse_view_counts(texts):
+    """
+    Convert view count strings like "50", "4.4K" or "1.2M" to integers.
+
+    All strings are parsed together with vectorized NumPy operations.
+
+    Args:
+        texts: View count strings matching the dashboard format
+
+    Returns:
+        NumPy int64 array with one view count per input string
+    """
+    counts = np.char.upper(np.char.strip(np.asarray(texts, dtype=str)))
+
+    multipliers = np.select(
+        [
+            np.char.endswith(counts, "K"),
+            np.char.endswith(counts, "M"),
+            np.char.endswith(counts, "B"),
+        ],
+        [1e3, 1e6, 1e9],
+        default=1.0,
+    )
+    values = np.char.strip(np.char.rstrip(counts, "KMB")).astype(np.float64)
+
+    return np.rint(values * multipliers).astype(np.int64)
+
 
 class InstagramInsightsScraper:
     """Scraper for Instagram Professional Dashboard Content Insights."""
 
-    def __init__(self, headless=False):
+    # Idle browsers kept for reuse by later scrapers in the same process,
+    # keyed by the options they were started with (a Chrome profile can
+    # only be open in one browser at a time, so drivers are not shared
+    # across keys)
+    _driver_pool = {}
+    _pool_lock = threading.Lock()
+    MAX_POOLED_DRIVERS = 4
+
+    def __init__(
+        self,
+        headless=False,
+        profile_dir=DEFAULT_PROFILE_DIR,
+        block_media=True,
+        debugger_port=None,
+        driver=None,
+    ):
         """
         Initialize the scraper with Chrome WebDriver.
 
         Args:
             headless: Run browser in headless mode (not recommended for login)
+            profile_dir: Chrome user data directory to reuse between runs,
+                so the login is kept (None for a fresh temporary profile)
+            block_media: Don't load images, video, fonts or analytics; only
+                the page text and layout are needed to read view counts.
+                Disable it if view counts ever move into the images.
+            debugger_port: Attach to a Chrome listening on this remote
+                debugging port, starting one first if none is running.
+                The browser stays open after close() for the next run.
+            driver: Already running WebDriver to use instead of starting
+                one; the browser options above are then ignored and
+                close() leaves the browser to the caller
+        """
+        self.profile_dir = profile_dir if driver is None else None
+        self.owns_driver = driver is None
+        self.insights_opened = False
+
+        # Build our own browser unless the caller hands one in. Browsers we
+        # start ourselves are taken from / returned to the pool.
+        self.attached = bool(debugger_port) and driver is None
+        self._pool_key = None
+        if driver is None:
+            if not debugger_port:
+                self._pool_key = (headless, profile_dir, block_media)
+                driver = self._take_pooled_driver(self._pool_key)
+            if driver is None:
+                driver = self._build_driver(
+                    headless, profile_dir, block_media, debugger_port
+                )
+        self.driver = driver
+
+        # Explicit waits only: an implicit wait would also delay every
+        # lookup that legitimately finds nothing, and mixing the two makes
+        # WebDriverWait timeouts unpredictable
+        self.driver.implicitly_wait(0)
+
+        self.driver.execute_script(
+            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        )
+
+        if block_media and self.owns_driver:
+            self.set_media_blocking(True)
+
+        self.wait = WebDriverWait(self.driver, 20)
+        self.posts_data = []
+
+        # Shared HTTP session for fetching images from the CDN. Downloads
+        # should go through self.http (or fetch_image) rather than bare
+        # requests.get/urlopen so connections are pooled and kept alive.
+        self.http = requests.Session()
+        self.http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=50,
+                max_retries=Retry(total=3, backoff_factor=0.5),
+            ),
+        )
+
+        # Output handles used when streaming posts during extraction
+        self._csv_file = None
+        self._csv_writer = None
+        self._jsonl_file = None
+        self._streamed_count = 0
+        self.streamed_to = None
+
+        # close() may be called from another thread when a run is cancelled
+        self._close_lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def _take_pooled_driver(cls, key):
+        """
+        Take an idle pooled driver started with the given options, if any.
+
+        Drivers whose browser has gone away while pooled (closed window,
+        crashed chromedriver) are quit and skipped.
+        """
+        while True:
+            with cls._pool_lock:
+                drivers = cls._driver_pool.get(key)
+                if not drivers:
+                    return None
+                driver = drivers.pop()
+
+            try:
+                driver.current_url
+            except Exception:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                continue
+
+            print("Reusing an already running browser")
+            return driver
+
+    @classmethod
+    def _return_pooled_driver(cls, key, driver):
+        """
+        Put a driver back into the pool for reuse.
+
+        Returns:
+            True if it was pooled, False if the pool is full
+        """
+        with cls._pool_lock:
+            pooled = sum(len(drivers) for drivers in cls._driver_pool.values())
+            if pooled >= cls.MAX_POOLED_DRIVERS:
+                return False
+            cls._driver_pool.setdefault(key, []).append(driver)
+            return True
+
+    @classmethod
+    def close_pool(cls):
+        """Quit all idle pooled browsers (also done at interpreter exit)."""
+        with cls._pool_lock:
+            drivers = [d for ds in cls._driver_pool.values() for d in ds]
+            cls._driver_pool.clear()
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def _build_driver(self, headless, profile_dir, block_media, debugger_port):
+        """
+        Start (or attach to) Chrome with the scraper's options.
+
+        Args:
+            headless: Run browser in headless mode
+            profile_dir: Chrome user data directory, or None
+            block_media: Don't load images
+            debugger_port: Remote debugging port to attach to, or None
+
+        Returns:
+            The Chrome WebDriver
         """
         self.options = Options()
         if headless:
-            self.options.add_argument("--headless")
+            # The new headless mode is the real browser; the legacy one
+            # also forces software GL
+            self.options.add_argument("--headless=new")
+
+        # Persistent profile keeps cookies and the logged-in session
+        if profile_dir:
+            self.options.add_argument(f"--user-data-dir={profile_dir}")
+            self.options.add_argument("--profile-directory=Default")
+
+        if block_media:
+            self.options.add_argument("--blink-settings=imagesEnabled=false")
 
         # Performance and compatibility options
-        self.options.add_argument("--disable-gpu")
         self.options.add_argument("--no-sandbox")
         self.options.add_argument("--disable-dev-shm-usage")
         self.options.add_argument("--disable-notifications")
@@ -41,60 +651,252 @@ class InstagramInsightsScraper:
         self.options.add_argument("--disable-popup-blocking")
         self.options.add_argument("--window-size=1920,1080")
 
+        # Keep timers and rendering at full speed while the window is in the
+        # background, so lazy loading doesn't stall during scraping
+        self.options.add_argument("--disable-background-timer-throttling")
+        self.options.add_argument("--disable-renderer-backgrounding")
+        self.options.add_argument("--disable-backgrounding-occluded-windows")
+
         # Avoid detection
         self.options.add_argument("--disable-blink-features=AutomationControlled")
         self.options.add_experimental_option("excludeSwitches", ["enable-automation"])
         self.options.add_experimental_option("useAutomationExtension", False)
 
+        # Reuse a long-running Chrome instead of cold-starting a new one
+        if debugger_port:
+            self._ensure_debug_chrome(debugger_port, profile_dir)
+            self.options = Options()
+            self.options.debugger_address = f"127.0.0.1:{debugger_port}"
+
         # Initialize driver
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.options)
+            service = Service(_chromedriver_path())
+            return webdriver.Chrome(service=service, options=self.options)
         except Exception as e:
             print(f"webdriver-manager failed: {e}")
             print("Falling back to direct Chrome driver...")
-            self.driver = webdriver.Chrome(options=self.options)
+            return webdriver.Chrome(options=self.options)
 
-        self.driver.implicitly_wait(5)
+    def _ensure_debug_chrome(self, port, profile_dir, startup_timeout=15):
+        """
+        Make sure a Chrome is listening on the given remote debugging port.
 
-        self.driver.execute_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        )
+        If none is running, start one with the scraper's command line
+        switches and wait until its DevTools endpoint answers.
 
-        self.wait = WebDriverWait(self.driver, 20)
-        self.posts_data = []
+        Args:
+            port: Remote debugging port
+            profile_dir: Chrome user data directory for a newly started
+                Chrome (required, Chrome refuses remote debugging on its
+                default profile)
+            startup_timeout: Seconds to wait for a newly started Chrome
+        """
+        version_url = f"http://127.0.0.1:{port}/json/version"
+
+        def debugger_ready():
+            try:
+                return requests.get(version_url, timeout=0.5).ok
+            except requests.RequestException:
+                return False
+
+        if debugger_ready():
+            print(f"Attaching to running Chrome on port {port}")
+            return
+
+        if not profile_dir:
+            raise RuntimeError(
+                "Starting Chrome for debugger_port needs a profile_dir; "
+                "Chrome ignores --remote-debugging-port on its default profile"
+            )
+
+        chrome = _find_chrome_binary()
+        if chrome is None:
+            raise RuntimeError(
+                "Chrome executable not found; set the CHROME_BINARY "
+                "environment variable to its path"
+            )
+
+        print(f"Starting Chrome with remote debugging on port {port}...")
+        try:
+            subprocess.Popen(
+                [chrome, f"--remote-debugging-port={port}", *self.options.arguments]
+            )
+        except OSError as e:
+            raise RuntimeError(
+                f"Could not start Chrome ({chrome}): {e}; set the CHROME_BINARY "
+                "environment variable to the Chrome executable"
+            ) from e
+
+        deadline = time.monotonic() + startup_timeout
+        while not debugger_ready():
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Chrome did not open debugging port {port}")
+            time.sleep(0.25)
+
+    def set_media_blocking(self, enabled):
+        """
+        Block or allow media, font and analytics requests via Chrome DevTools.
+
+        Args:
+            enabled: True to block these requests, False to load them again
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": BLOCKED_MEDIA_URLS if enabled else []},
+            )
+        except Exception as e:
+            print(f"Could not change media blocking: {e}")
 
     def open_instagram(self):
-        """Open Instagram login page."""
+        """
+        Open Instagram login page.
+
+        With a persistent profile that is still logged in, Instagram
+        redirects away from the login page. If Content Insights was opened
+        with this profile before, the scraper then goes straight there.
+        """
         self.driver.get("https://www.instagram.com/accounts/login/")
-        print("Browser opened. Please log in to your Instagram account.")
+        self.insights_opened = False
+
+        try:
+            WebDriverWait(self.driver, 3).until(
+                lambda d: "accounts/login" not in d.current_url
+            )
+            logged_in = True
+        except TimeoutException:
+            logged_in = False
+
+        insights_url = self._load_insights_url()
+        if logged_in and insights_url:
+            self.driver.get(insights_url)
+            self.insights_opened = True
+            print("Already logged in. Opened Content Insights.")
+            return
+
+        if logged_in:
+            print("Browser opened. Already logged in to Instagram.")
+        else:
+            print("Browser opened. Please log in to your Instagram account.")
         print(
             "After logging in, navigate to: Professional Dashboard > Content Insights"
         )
 
-    def wait_for_manual_login(self):
-        """Wait for user to complete manual login and navigation."""
-        input(
-            "\nPress ENTER after you've logged in and navigated to Content Insights..."
+    def _insights_url_file(self):
+        """Path of the file remembering the Content Insights URL, or None."""
+        if not self.profile_dir:
+            return None
+        return os.path.join(self.profile_dir, INSIGHTS_URL_FILE)
+
+    @staticmethod
+    def _is_insights_url(url):
+        """Return True if the URL looks like an Instagram insights page."""
+        parts = urlsplit(url or "")
+        return parts.netloc.endswith("instagram.com") and any(
+            marker in parts.path for marker in INSIGHTS_URL_MARKERS
         )
-        time.sleep(2)
 
-    def scroll_to_load_all_posts(self, expected_posts=None, max_scrolls=50):
+    def _load_insights_url(self):
+        """Content Insights URL saved by an earlier run with this profile."""
+        path = self._insights_url_file()
+        if not path or not os.path.exists(path):
+            return None
+
+        with open(path, encoding="utf-8") as f:
+            url = f.read().strip()
+        return url if self._is_insights_url(url) else None
+
+    def _save_insights_url(self):
+        """Remember the current page as this profile's Content Insights URL."""
+        path = self._insights_url_file()
+        url = self.driver.current_url
+        if not path:
+            return
+        if not self._is_insights_url(url):
+            print(f"Not remembering {url}: it doesn't look like Content Insights")
+            return
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(url)
+
+    def _forget_insights_url(self):
+        """Delete this profile's saved Content Insights URL, if any."""
+        path = self._insights_url_file()
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def wait_for_manual_login(self, label=None, cancel=None):
+        """
+        Wait for user to complete manual login and navigation.
+
+        Skipped when open_instagram already went to Content Insights, unless
+        the saved page no longer shows the post grid.
+
+        Args:
+            label: Name shown with the prompt, to tell browser windows apart
+                when several scrapers run at once
+            cancel: threading.Event; once set, return without prompting
+        """
+        while True:
+            if not self.insights_opened:
+                prefix = f"[{label}] " if label else ""
+
+                # One prompt at a time; the other scrapers keep working
+                with _PROMPT_LOCK:
+                    if cancel is not None and cancel.is_set():
+                        return
+                    input(
+                        f"\n{prefix}Press ENTER after you've logged in and "
+                        "navigated to Content Insights..."
+                    )
+
+            # Wait for the post grid to render instead of sleeping a fixed time
+            try:
+                self.wait.until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "img[src*='instagram']")
+                    )
+                )
+            except TimeoutException:
+                if self.insights_opened:
+                    # The saved page is stale; ask again and save the new one
+                    print("Saved Content Insights page shows no posts.")
+                    self._forget_insights_url()
+                    self.insights_opened = False
+                    continue
+                print("Post images did not appear yet, continuing anyway...")
+                return
+
+            if not self.insights_opened:
+                self._save_insights_url()
+            return
+
+    def scroll_to_load_all_posts(
+        self, expected_posts=None, max_scrolls=50, scroll_timeout=3
+    ):
         """
         Scroll down to load all posts using lazy loading.
 
         Args:
             expected_posts: Expected number of posts (optional, for progress tracking)
             max_scrolls: Maximum number of scroll attempts
+            scroll_timeout: Seconds to wait for new content after each scroll
         """
         print(f"\nScrolling to load all posts...")
         if expected_posts:
             print(f"Expected posts: {expected_posts}")
 
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        last_height, last_posts = self._scroll_state()
         scroll_count = 0
         no_change_count = 0
 
+        def new_content_loaded(driver):
+            # More posts is the real signal; a taller page also counts, since
+            # a virtualized grid can swap posts out while it keeps growing
+            height, posts = self._scroll_state()
+            return posts > last_posts or height > last_height
+
         while scroll_count < max_scrolls:
             # Scroll down
             self.driver.execute_script(
@@ -102,182 +904,123 @@ class InstagramInsightsScraper:
             )
             scroll_count += 1
 
-            # Wait for content to load
-            time.sleep(1.5)
-
-            # Calculate new scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            # Wait for content to load, continuing as soon as new posts arrive
+            try:
+                WebDriverWait(
+                    self.driver, scroll_timeout, poll_frequency=0.2
+                ).until(new_content_loaded)
+            except TimeoutException:
+                pass
 
-            # Check current number of posts loaded
-            current_posts = self._count_visible_posts()
+            # Calculate new scroll height and number of posts loaded
+            new_height, current_posts = self._scroll_state()
             print(f"  Scroll {scroll_count}: {current_posts} posts loaded...")
 
-            # Check if we've reached the bottom
-            if new_height == last_height:
+            # Check if we've reached the bottom: no new posts and no growth
+            if current_posts <= last_posts and new_height <= last_height:
                 no_change_count += 1
-                if no_change_count >= 3:  # No change for 3 scrolls
+                if no_change_count >= 2:  # No change for 2 scrolls
                     print(f"  Reached bottom of page after {scroll_count} scrolls")
                     break
             else:
                 no_change_count = 0
 
-            last_height = new_height
+            last_height = max(last_height, new_height)
+            last_posts = max(last_posts, current_posts)
 
             # If we have expected_posts and reached it, stop
             if expected_posts and current_posts >= expected_posts:
                 print(f"  Loaded all {expected_posts} expected posts")
                 break
 
-        # Scroll back to top
+        # Scroll back to top and wait until the page is actually there
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        try:
+            WebDriverWait(self.driver, 2, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return window.scrollY") == 0
+            )
+        except TimeoutException:
+            pass
 
         print(f"Scrolling complete. Total scrolls: {scroll_count}")
 
-    def _count_visible_posts(self):
-        """Count the number of post elements currently loaded."""
-        try:
-            # Try to count images in the grid
-            images = self.driver.find_elements(
-                By.XPATH,
-                "//img[contains(@src, 'cdninstagram') or contains(@src, 'instagram')]",
-            )
-            return len(images)
-        except:
-            return 0
+    def _scroll_state(self):
+        """
+        Read the page height and the number of loaded posts in one call.
 
-    def extract_post_views(self):
+        Posts are counted as grid images ('cdninstagram' also contains
+        'instagram', so one substring selector covers both hosts). The count
+        is taken in the page, so no WebElement is created per image.
+
+        Returns:
+            Tuple of (scroll height, post count)
+        """
+        height, posts = self.driver.execute_script(
+            "return [document.body.scrollHeight, "
+            "document.querySelectorAll(\"img[src*='instagram']\").length];"
+        )
+        return height, posts
+
+    def extract_post_views(self, stream=False, timeout=120, graphql_query=None):
         """
         Extract views data from post elements in Content Insights.
         Handles numbers like: 50, 4.4K, 3.5K, 1.2M, etc.
 
+        Args:
+            stream: Write each post to CSV and JSONL as soon as it is extracted
+            timeout: Seconds after which the page sweep stops and keeps
+                what it has collected so far
+            graphql_query: Optional (doc_id, variables, connection_path) of
+                the GraphQL query listing the posts (see fetch_graphql_edges).
+                The posts are then read from the API, and the page is only
+                swept if that fails.
+
         Returns:
             List of dictionaries containing post data
         """
         posts_data = []
 
+        # Output streamed by an earlier extraction belongs to those posts;
+        # start fresh files, or let save_to_csv/save_to_json write this run
+        self._close_streams()
+        self.streamed_to = None
+
         print("\n" + "=" * 50)
         print("EXTRACTING POST VIEW COUNTS")
         print("=" * 50)
 
-        # Use JavaScript to extract ALL numbers with their positions
-        # This handles: 50, 100, 4.4K, 3.5K, 1.2M, etc.
-        js_script = """
-        const results = [];
-        
-        // Get all text-containing elements
-        const allElements = document.querySelectorAll('span, div, p');
-        
-        allElements.forEach(el => {
-            // Get direct text content only (not nested)
-            let text = '';
-            for (let node of el.childNodes) {
-                if (node.nodeType === Node.TEXT_NODE) {
-                    text += node.textContent;
-                }
-            }
-            text = text.trim();
-            
-            // Also check el.innerText if direct text is empty
-            if (!text && el.children.length === 0) {
-                text = el.innerText.trim();
-            }
-            
-            if (!text) return;
-            
-            // Match patterns:
-            // - Plain numbers: 50, 100, 1000
-            // - Decimal with K/M/B: 4.4K, 3.5K, 1.2M, 2.5B
-            // - Plain with K/M/B: 100K, 50M
-            const pattern = /^(\d+\.?\d*)\s*([KMBkmb])?$/;
-            const match = text.match(pattern);
-            
-            if (match) {
-                const rect = el.getBoundingClientRect();
-                
-                // Must be visible and in reasonable position
-                if (rect.width > 0 && rect.height > 0 && 
-                    rect.top > 50 && rect.top < 10000 &&
-                    rect.left > 0 && rect.left < 2000) {
-                    
-                    results.push({
-                        text: text,
-                        top: rect.top + window.scrollY,  // Absolute position
-                        left: rect.left,
-                        width: rect.width,
-                        height: rect.height
-                    });
-                }
-            }
-        });
-        
-        return results;
-        """
+        if graphql_query is not None:
+            print("Fetching posts from the GraphQL API...")
+            posts_data = self._posts_from_graphql(*graphql_query)
+            if posts_data:
+                return self._record_posts(posts_data, stream)
+            print("Falling back to reading the page...")
 
-        # First, scroll through the entire page to get all positions
+        # Scroll through the entire page to get all positions (see _HARVEST_JS)
         print("Collecting all numbers from the page...")
 
-        all_numbers = []
-
-        # Get page height
-        total_height = self.driver.execute_script("return document.body.scrollHeight")
-        viewport_height = self.driver.execute_script("return window.innerHeight")
-
-        # Scroll and collect numbers
-        scroll_position = 0
-        while scroll_position < total_height:
-            self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-            time.sleep(0.5)
-
-            # Execute JS to get numbers at current scroll position
-            numbers = self.driver.execute_script(js_script)
-            all_numbers.extend(numbers)
-
-            scroll_position += viewport_height - 100  # Overlap slightly
-
-        # Scroll back to top
-        self.driver.execute_script("window.scrollTo(0, 0);")
-
-        print(f"Found {len(all_numbers)} total number elements")
-
-        # Deduplicate based on position and value
-        unique_numbers = []
-        seen = set()
-
-        for num in all_numbers:
-            # Create unique key based on approximate position (grid of ~150px)
-            grid_x = int(num["left"] // 150)
-            grid_y = int(num["top"] // 150)
-            key = f"{grid_x}_{grid_y}_{num['text']}"
-
-            if key not in seen:
-                seen.add(key)
-                unique_numbers.append(num)
+        self.driver.set_script_timeout(timeout + 30)
+        collected = self.driver.execute_async_script(
+            _HARVEST_JS, _VIEW_COUNT_PATTERN, 200, 1500, timeout * 1000
+        )
 
-        print(f"After deduplication: {len(unique_numbers)} unique numbers")
+        # The collector already drops repeats of the same value in the same
+        # ~150px grid cell, so these are unique numbers. Their boxes come
+        # back as one flat [top, left, width, height, ...] array.
+        texts = collected["texts"]
+        rects = np.asarray(collected["rects"], dtype=np.float64).reshape(-1, 4)
+        all_images = collected["images"]
+
+        if collected.get("timedOut"):
+            print(
+                f"Warning: stopped after {timeout}s before reaching the end "
+                "of the page; some posts may be missing"
+            )
 
-        # Sort by position (top to bottom, left to right)
-        # Group by rows (posts in same row have similar Y values)
-        unique_numbers.sort(key=lambda x: (int(x["top"] // 200), x["left"]))
+        print(f"Found {len(texts)} unique number elements")
 
         # Filter to keep only likely view counts
-        # View counts are typically shown once per post, in a specific size range
-        view_counts = []
-        seen_positions = set()
-
-        for num in unique_numbers:
-            # Skip very small or very large elements (likely not view counts)
-            if num["width"] < 10 or num["width"] > 100:
-                continue
-            if num["height"] < 10 or num["height"] > 50:
-                continue
-
-            # Use a coarser grid for final deduplication (one number per ~250px cell)
-            pos_key = f"{int(num['left'] // 250)}_{int(num['top'] // 250)}"
-
-            if pos_key not in seen_positions:
-                seen_positions.add(pos_key)
-                view_counts.append(num)
+        view_counts = self._select_view_counts(texts, rects)
 
         print(f"Filtered to {len(view_counts)} likely view counts")
 
@@ -291,79 +1034,229 @@ class InstagramInsightsScraper:
             # Sort again to ensure correct order
             view_counts.sort(key=lambda x: (int(x["top"] // 200), x["left"]))
 
-            print(f"\nExtracted {len(view_counts)} posts:")
-            print("-" * 30)
+            # All posts of one extraction share the same timestamp
+            scraped_at = datetime.now().isoformat()
+
+            # Numeric view counts for all posts at once
+            views_int = parse_view_counts([num["text"] for num in view_counts])
 
             for i, num_data in enumerate(view_counts):
+                image = self._find_image_under(num_data, all_images)
                 post_data = {
                     "label": f"image{i + 1}",
                     "views": num_data["text"],
+                    "views_int": int(views_int[i]),
                     "likes": None,
                     "comments": None,
                     "shares": None,
                     "saves": None,
-                    "image_src": None,
-                    "alt_text": None,
-                    "scraped_at": datetime.now().isoformat(),
+                    "image_src": image["src"] if image else None,
+                    "alt_text": image["alt"] if image else None,
+                    "scraped_at": scraped_at,
                 }
                 posts_data.append(post_data)
-                print(f"  {post_data['label']}: {num_data['text']} views")
+
+        return self._record_posts(posts_data, stream)
+
+    def _posts_from_graphql(self, doc_id, variables, connection_path):
+        """
+        Build post entries from the nodes of a GraphQL connection.
+
+        Args:
+            doc_id: GraphQL query id, see fetch_graphql_edges
+            variables: Query variables, see fetch_graphql_edges
+            connection_path: Keys leading to the connection, see
+                fetch_graphql_edges
+
+        Returns:
+            List of post dictionaries (same fields as the page extraction),
+            or an empty list if the request failed or a node carries no
+            view count
+        """
+        nodes = self.fetch_graphql_edges(doc_id, variables, connection_path)
+        if not nodes:
+            return []
+
+        scraped_at = datetime.now().isoformat()
+        posts_data = []
+
+        for i, node in enumerate(nodes):
+            views = _graphql_count(node, "video_view_count", "play_count", "view_count")
+            if views is None:
+                print("GraphQL response has posts without view counts")
+                return []
+
+            posts_data.append(
+                {
+                    "label": f"image{i + 1}",
+                    "views": str(views),
+                    "views_int": views,
+                    "likes": _graphql_count(
+                        node, "like_count", "edge_liked_by", "edge_media_preview_like"
+                    ),
+                    "comments": _graphql_count(
+                        node, "comment_count", "edge_media_to_comment"
+                    ),
+                    "shares": _graphql_count(node, "share_count"),
+                    "saves": _graphql_count(node, "save_count"),
+                    "image_src": node.get("display_url") or node.get("thumbnail_src"),
+                    "alt_text": node.get("accessibility_caption"),
+                    "scraped_at": scraped_at,
+                }
+            )
+
+        return posts_data
+
+    def _record_posts(self, posts_data, stream):
+        """
+        Keep the extracted posts, writing them out first when streaming.
+
+        Args:
+            posts_data: Post dictionaries of this extraction
+            stream: Write the posts to the CSV and JSONL stream files
+
+        Returns:
+            The posts
+        """
+        if stream:
+            for post_data in posts_data:
+                self._stream_post(post_data)
+
+            # Every row is written by now; close the files so they are
+            # complete on disk before save_to_csv/save_to_json point to them
+            self._close_streams()
+
+        if posts_data:
+            # One summary line; print_summary lists the individual posts
+            print(f"\nExtracted {len(posts_data)} posts")
 
         self.posts_data = posts_data
         return posts_data
 
+    @staticmethod
+    def _select_view_counts(texts, rects):
+        """
+        Pick the likely view counts out of the collected numbers.
+
+        The numbers are sorted by position (top to bottom in ~200px rows,
+        then left to right), filtered to the size range of view count
+        labels, and reduced to one number per ~250px cell, since view
+        counts are shown once per post. The passes run as vectorized NumPy
+        operations over the positions instead of per-dict Python loops.
+
+        Args:
+            texts: Number texts
+            rects: Array of shape (len(texts), 4) with each number's
+                top, left, width and height
+
+        Returns:
+            The selected numbers as text/top/left/width/height dictionaries,
+            in position order
+        """
+        if not texts:
+            return []
+
+        tops, lefts, widths, heights = rects.T
+
+        # Sort by position (top to bottom, left to right)
+        # Group by rows (posts in same row have similar Y values)
+        order = np.lexsort((lefts, tops // 200))
+
+        # Skip very small or very large elements (likely not view counts)
+        size_ok = (widths >= 10) & (widths <= 100) & (heights >= 10) & (heights <= 50)
+        order = order[size_ok[order]]
+
+        # Use a coarser grid for final deduplication (one number per ~250px
+        # cell), keeping the first number of each cell in sorted order
+        cell_x = (lefts // 250).astype(np.int64)
+        cell_y = (tops // 250).astype(np.int64)
+        cells = (cell_x << 32) | cell_y
+        _, first = np.unique(cells[order], return_index=True)
+        order = order[np.sort(first)]
+
+        return [
+            {
+                "text": texts[i],
+                "top": float(tops[i]),
+                "left": float(lefts[i]),
+                "width": float(widths[i]),
+                "height": float(heights[i]),
+            }
+            for i in order
+        ]
+
+    @staticmethod
+    def _find_image_under(num_data, images):
+        """
+        Find the post image whose box contains the centre of a view count.
+
+        Args:
+            num_data: Number entry with top/left/width/height
+            images: Image entries collected alongside the numbers
+
+        Returns:
+            The matching image entry, or None
+        """
+        x = num_data["left"] + num_data["width"] / 2
+        y = num_data["top"] + num_data["height"] / 2
+
+        for image in images:
+            if (
+                image["left"] <= x <= image["left"] + image["width"]
+                and image["top"] <= y <= image["top"] + image["height"]
+            ):
+                return image
+
+        return None
+
     def _extract_with_xpath(self):
-        """Alternative extraction using XPath directly."""
+        """Alternative extraction scanning all spans in a single script call."""
         print("Using XPath extraction...")
 
         results = []
         seen_positions = set()
 
-        # Find all spans that might contain view counts
-        # Pattern matches: numbers with optional decimal and K/M/B suffix
+        # Read text, position and size of every matching span in a single
+        # round trip instead of three WebDriver calls per span. Text and
+        # pattern are checked before layout is read, so only view-count
+        # candidates are measured and sent back.
+        js_script = """
+        const pattern = new RegExp(arguments[0]);
+        const spans = document.getElementsByTagName('span');
+        const results = [];
+
+        for (let i = 0, n = spans.length; i < n; i++) {
+            const span = spans[i];
+            const text = (span.textContent || '').trim();
+            if (!text || !pattern.test(text)) continue;
+
+            const rect = span.getBoundingClientRect();
+
+            // Skip if not visible, too small or too large
+            if (rect.width < 15 || rect.width > 80 || rect.height <= 0) continue;
+
+            results.push({
+                text: text,
+                top: rect.top + window.scrollY,
+                left: rect.left + window.scrollX,
+                width: rect.width,
+                height: rect.height
+            });
+        }
+        return results;
+        """
+
         try:
-            # Get all spans
-            spans = self.driver.find_elements(By.TAG_NAME, "span")
-            print(f"Found {len(spans)} span elements")
+            spans = self.driver.execute_script(js_script, _VIEW_COUNT_PATTERN)
+            print(f"Found {len(spans)} matching span elements")
 
             for span in spans:
-                try:
-                    text = span.text.strip()
-                    if not text:
-                        continue
-
-                    # Check if it matches our pattern
-                    if re.match(r"^\d+\.?\d*[KMBkmb]?$", text):
-                        location = span.location
-                        size = span.size
-
-                        # Skip if not visible
-                        if size["width"] <= 0 or size["height"] <= 0:
-                            continue
-
-                        # Skip if too small or too large
-                        if size["width"] < 15 or size["width"] > 80:
-                            continue
-
-                        # Deduplicate by position
-                        pos_key = f"{location['x'] // 200}_{location['y'] // 200}"
-
-                        if pos_key not in seen_positions:
-                            seen_positions.add(pos_key)
-                            results.append(
-                                {
-                                    "text": text,
-                                    "top": location["y"],
-                                    "left": location["x"],
-                                    "width": size["width"],
-                                    "height": size["height"],
-                                }
-                            )
-
-                except StaleElementReferenceException:
-                    continue
-                except Exception as e:
-                    continue
+                # Deduplicate by position
+                pos_key = f"{int(span['left'] // 200)}_{int(span['top'] // 200)}"
+
+                if pos_key not in seen_positions:
+                    seen_positions.add(pos_key)
+                    results.append(span)
 
         except Exception as e:
             print(f"XPath extraction error: {e}")
@@ -371,8 +1264,188 @@ class InstagramInsightsScraper:
         print(f"XPath found {len(results)} view counts")
         return results
 
+    def fetch_image(self, url, timeout=10):
+        """
+        Download an image (e.g. a post's image_src) using the shared session.
+
+        Args:
+            url: Image URL to fetch
+            timeout: Request timeout in seconds
+
+        Returns:
+            Raw image bytes
+        """
+        response = self.http.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    def sync_http_cookies(self):
+        """
+        Copy the browser's cookies into the shared HTTP session.
+
+        After logging in through the browser this lets self.http make
+        authenticated requests to Instagram directly.
+
+        Returns:
+            The csrftoken cookie value, or None if there is none
+        """
+        csrf_token = None
+        for cookie in self.driver.get_cookies():
+            self.http.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+            if cookie["name"] == "csrftoken":
+                csrf_token = cookie["value"]
+
+        return csrf_token
+
+    def fetch_graphql_edges(self, doc_id, variables, connection_path, page_delay=1.0):
+        """
+        Fetch every node of a paginated Instagram GraphQL connection.
+
+        Uses the logged-in browser's cookies, so no scrolling or DOM parsing
+        is needed. Instagram does not publish its query ids or response
+        layout, so both have to be taken from the web client's own requests
+        (browser devtools, Network tab).
+
+        Args:
+            doc_id: GraphQL query id the web client uses for the data
+            variables: Query variables, without the pagination cursor
+            connection_path: Keys leading from the response JSON to the
+                connection holding 'edges' and 'page_info'
+            page_delay: Seconds to wait between page requests, to stay
+                clear of Instagram's rate limits
+
+        Returns:
+            List of node dictionaries, or None if Instagram refused the
+            request (an error status, a login page or an error body instead
+            of the expected JSON) or could not be reached, and the browser
+            extraction should be used
+        """
+        headers = {
+            "x-ig-app-id": INSTAGRAM_WEB_APP_ID,
+            "x-csrftoken": self.sync_http_cookies() or "",
+            "x-requested-with": "XMLHttpRequest",
+            "referer": self.driver.current_url,
+        }
+
+        nodes = []
+        cursor = None
+
+        while True:
+            page_variables = dict(variables)
+            if cursor:
+                page_variables["after"] = cursor
+                time.sleep(page_delay)
+
+            try:
+                response = self.http.post(
+                    GRAPHQL_URL,
+                    data={"doc_id": doc_id, "variables": json.dumps(page_variables)},
+                    headers=headers,
+                    timeout=10,
+                )
+            except requests.RequestException as e:
+                print(f"GraphQL request failed ({e})")
+                return None
+            if not response.ok:
+                print(f"GraphQL request refused ({response.status_code})")
+                return None
+
+            # An expired session or checkpoint answers 200 with a login page
+            # or a {"message": ...} error body instead of the data
+            try:
+                payload = response.json()
+            except ValueError:
+                print("GraphQL request refused (response is not JSON)")
+                return None
+
+            try:
+                connection = payload
+                for key in connection_path:
+                    connection = connection[key]
+                page_nodes = [edge["node"] for edge in connection["edges"]]
+                page_info = connection["page_info"]
+                cursor = page_info["end_cursor"] if page_info["has_next_page"] else None
+            except (KeyError, IndexError, TypeError):
+                message = payload.get("message") if isinstance(payload, dict) else None
+                print(f"GraphQL request refused ({message or 'unexpected response'})")
+                return None
+
+            nodes.extend(page_nodes)
+            if not cursor:
+                break
+
+        return nodes
+
+    def _stream_post(
+        self,
+        post_data,
+        csv_filename="instagram_insights.csv",
+        jsonl_filename="instagram_insights.jsonl",
+        flush_every=10,
+    ):
+        """
+        Append a single post to the CSV and JSONL output files.
+
+        The files are opened on the first post with a 1 MiB write buffer
+        and closed once extract_post_views has written every post.
+
+        Args:
+            post_data: Post dictionary to write
+            csv_filename: CSV file to write rows to
+            jsonl_filename: Newline-delimited JSON file to write records to
+            flush_every: Flush both files after this many posts
+        """
+        if self._csv_writer is None:
+            self._csv_file = open(
+                csv_filename,
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=STREAM_BUFFER_SIZE,
+            )
+            self._csv_writer = csv.DictWriter(
+                self._csv_file, fieldnames=post_data.keys()
+            )
+            self._csv_writer.writeheader()
+            self._jsonl_file = open(
+                jsonl_filename, "w", encoding="utf-8", buffering=STREAM_BUFFER_SIZE
+            )
+            self.streamed_to = (csv_filename, jsonl_filename)
+            print(f"Streaming posts to {csv_filename} and {jsonl_filename}")
+
+        self._csv_writer.writerow(post_data)
+        if orjson is not None:
+            self._jsonl_file.write(orjson.dumps(post_data).decode() + "\n")
+        else:
+            self._jsonl_file.write(json.dumps(post_data, ensure_ascii=False) + "\n")
+
+        self._streamed_count += 1
+        if self._streamed_count % flush_every == 0:
+            self._csv_file.flush()
+            self._jsonl_file.flush()
+
+    def _close_streams(self):
+        """Close any output files opened while streaming posts."""
+        for f in (self._csv_file, self._jsonl_file):
+            if f is not None:
+                f.close()
+
+        self._csv_file = None
+        self._csv_writer = None
+        self._jsonl_file = None
+        self._streamed_count = 0
+
     def save_to_csv(self, filename="instagram_insights.csv"):
-        """Save scraped data to CSV file."""
+        """Save scraped data to CSV file (no-op if posts were streamed)."""
+        if self.streamed_to:
+            print(f"\nPosts already streamed to {self.streamed_to[0]}")
+            return
+
         if not self.posts_data:
             print("No data to save!")
             return
@@ -385,13 +1458,21 @@ class InstagramInsightsScraper:
         print(f"\nData saved to {filename}")
 
     def save_to_json(self, filename="instagram_insights.json"):
-        """Save scraped data to JSON file."""
+        """Save scraped data to JSON file (no-op if posts were streamed)."""
+        if self.streamed_to:
+            print(f"Posts already streamed to {self.streamed_to[1]}")
+            return
+
         if not self.posts_data:
             print("No data to save!")
             return
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.posts_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(self.posts_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(self.posts_data, f, indent=2, ensure_ascii=False)
 
         print(f"Data saved to {filename}")
 
@@ -414,10 +1495,216 @@ class InstagramInsightsScraper:
         if len(self.posts_data) > 10:
             print(f"  ... and {len(self.posts_data) - 10} more")
 
-    def close(self):
-        """Close the browser."""
+    def _clear_login_state(self):
+        """
+        Remove every cookie and Instagram's site storage from the browser.
+
+        WebDriver's delete_all_cookies only covers the current page's
+        domain, so this goes through Chrome DevTools instead.
+        """
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        self.driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin",
+            {"origin": "https://www.instagram.com", "storageTypes": "all"},
+        )
+
+    def close(self, keep_browser=True):
+        """
+        Close any streamed output files, the HTTP session and the browser.
+
+        Args:
+            keep_browser: Keep a browser this scraper started in the pool
+                for the next scraper with the same options instead of
+                quitting it
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self._close_streams()
+        self.http.close()
+
+        if not self.owns_driver:
+            print("\nLeft the browser open for its owner.")
+            return
+
+        # Keep browsers we started for the next scraper. Cookies of a
+        # persistent profile are left alone so it stays logged in; a
+        # temporary profile is cleared so the next user starts logged out.
+        if keep_browser and self._pool_key is not None:
+            try:
+                if self.profile_dir is None:
+                    self._clear_login_state()
+                self.driver.get("about:blank")
+                if self._return_pooled_driver(self._pool_key, self.driver):
+                    print("\nBrowser kept open for reuse until exit.")
+                    return
+            except Exception:
+                pass
+
+        # For an attached Chrome this only ends the WebDriver session; the
+        # browser was not started by chromedriver and keeps running
         self.driver.quit()
-        print("\nBrowser closed.")
+        if self.attached:
+            print("\nDetached from browser.")
+        else:
+            print("\nBrowser closed.")
+
+
+atexit.register(InstagramInsightsScraper.close_pool)
+
+
+def scrape_profile(profile_dir, expected_posts=None, cancel=None, running=None):
+    """
+    Run a complete scrape in its own browser with the given Chrome profile.
+
+    Results are saved to instagram_insights_<profile name>.csv/.json.
+
+    Args:
+        profile_dir: Chrome user data directory of the account to scrape
+        expected_posts: Expected number of posts (optional)
+        cancel: threading.Event; once set, the scrape stops before its
+            next step
+        running: Set the scraper is kept in while it runs, so it can be
+            closed from another thread
+
+    Returns:
+        List of dictionaries containing post data, or None if cancelled
+    """
+
+    def cancelled():
+        return cancel is not None and cancel.is_set()
+
+    if cancelled():
+        return None
+
+    name = _profile_name(profile_dir)
+    scraper = InstagramInsightsScraper(headless=False, profile_dir=profile_dir)
+    if running is not None:
+        running.add(scraper)
+
+    try:
+        scraper.open_instagram()
+        scraper.wait_for_manual_login(label=name, cancel=cancel)
+        if cancelled():
+            return None
+
+        scraper.scroll_to_load_all_posts(expected_posts=expected_posts)
+        if cancelled():
+            return None
+
+        posts = scraper.extract_post_views()
+        if posts:
+            scraper.save_to_csv(f"instagram_insights_{name}.csv")
+            scraper.save_to_json(f"instagram_insights_{name}.json")
+
+        return posts
+
+    finally:
+        if running is not None:
+            running.discard(scraper)
+        # Each profile is scraped once per run, so a pooled browser would
+        # only sit idle holding the profile open
+        scraper.close(keep_browser=False)
+
+
+async def _to_daemon_thread(func, *args):
+    """
+    Run a blocking function in a daemon thread and await its result.
+
+    Unlike asyncio.to_thread, a call that is abandoned (e.g. stuck at an
+    input() prompt after Ctrl-C) doesn't keep the interpreter from exiting.
+
+    Args:
+        func: Function to call
+        args: Positional arguments for func
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run():
+        try:
+            outcome = (func(*args), None)
+        except BaseException as e:
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # The event loop is already closed
+
+    threading.Thread(target=run, daemon=True).start()
+    return await future
+
+
+async def scrape_profiles(profile_dirs, expected_posts=None, max_concurrency=4):
+    """
+    Scrape several accounts concurrently, one browser per Chrome profile.
+
+    Each scrape runs its blocking Selenium calls in a worker thread. At
+    most max_concurrency browsers are open at a time to stay clear of
+    Instagram's rate limits. When the run is cancelled (Ctrl-C), the
+    workers stop at their next step and the open browsers are closed.
+
+    Args:
+        profile_dirs: Chrome user data directories, one per account
+        expected_posts: Expected number of posts per account (optional)
+        max_concurrency: Maximum number of browsers running at once
+
+    Returns:
+        Dictionary mapping each profile directory to its list of posts,
+        or to the exception its scrape raised (None if it was cancelled)
+
+    Raises:
+        ValueError: If two profile directories share a name, since their
+            output files would overwrite each other
+    """
+    names = [_profile_name(profile_dir) for profile_dir in profile_dirs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(
+            f"Profile directories must have distinct names: {', '.join(duplicates)}"
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    cancel = threading.Event()
+    running = set()
+
+    async def bounded(profile_dir):
+        async with semaphore:
+            return await _to_daemon_thread(
+                scrape_profile, profile_dir, expected_posts, cancel, running
+            )
+
+    try:
+        results = await asyncio.gather(
+            *(bounded(profile_dir) for profile_dir in profile_dirs),
+            return_exceptions=True,
+        )
+    except asyncio.CancelledError:
+        # Workers waiting at the login prompt are abandoned; the others see
+        # the event, and their browsers are closed here rather than when
+        # each thread gets to its finally
+        cancel.set()
+        for scraper in list(running):
+            try:
+                scraper.close(keep_browser=False)
+            except Exception:
+                pass
+        raise
+
+    return dict(zip(profile_dirs, results))
 
 
 def main():
@@ -435,6 +1722,28 @@ def main():
     except ValueError:
         expected_posts = None
 
+    # Chrome profile directories on the command line: scrape those accounts
+    # side by side instead of running the single interactive session
+    profile_dirs = sys.argv[1:]
+    if profile_dirs:
+        try:
+            results = asyncio.run(scrape_profiles(profile_dirs, expected_posts))
+        except KeyboardInterrupt:
+            print("\n\nScraping interrupted by user.")
+            return
+
+        print("\n" + "=" * 50)
+        print("SCRAPING SUMMARY")
+        print("=" * 50)
+        for profile_dir, result in results.items():
+            if isinstance(result, Exception):
+                print(f"  {profile_dir}: failed ({result})")
+            elif result is None:
+                print(f"  {profile_dir}: cancelled")
+            else:
+                print(f"  {profile_dir}: {len(result)} posts")
+        return
+
     # Initialize scraper
     scraper = InstagramInsightsScraper(headless=False)
 
@@ -471,7 +1780,8 @@ def main():
 
     finally:
         input("\nPress ENTER to close the browser...")
-        scraper.close()
+        # Nothing in this run could reuse a pooled browser
+        scraper.close(keep_browser=False)
 
 
 if __name__ == "__main__":